@@ -9,6 +9,7 @@ from torchdynamo import config
 from torchdynamo.testing import unsupported
 
 globalmod = torch.nn.ReLU()
+globalbias = torch.ones(10) * 3
 
 
 def indirectly_unsupported(a, b):
@@ -16,6 +17,12 @@ def indirectly_unsupported(a, b):
     return unsupported(a, c)
 
 
+def inline_then_break(a):
+    # adds a submodule and a graph input before breaking the graph
+    b = globalmod(a) * globalbias
+    return unsupported(a, b)
+
+
 class SubGraphTests(torchdynamo.testing.TestCase):
     def _common(self, fn, frame_count, op_count):
         torchdynamo.reset()
@@ -134,6 +141,33 @@ class SubGraphTests(torchdynamo.testing.TestCase):
 
         self._common(fn, 2, 3)
 
+    def test_inlined_graph_break_rollback(self):
+        def fn(a, b):
+            x = a - b
+            x = inline_then_break(x)
+            return globalmod(x) + globalbias
+
+        def placeholders(gm):
+            return [n.target for n in gm.graph.nodes if n.op == "placeholder"]
+
+        graphs = []
+
+        def compiler_fn(gm, example_inputs):
+            graphs.append(gm)
+            return gm.forward
+
+        v1 = torch.randn(10)
+        v2 = torch.randn(10)
+        correct = fn(v1, v2)
+        with torchdynamo.optimize(compiler_fn):
+            result = fn(v1, v2)
+        self.assertTrue(torchdynamo.testing.same(result, correct))
+        self.assertEqual(len(graphs), 3)
+        # globalbias was rolled back with the failed inline
+        self.assertEqual(placeholders(graphs[0]), ["a", "b"])
+        self.assertEqual(placeholders(graphs[1]), ["a", "globalbias"])
+        self.assertEqual(placeholders(graphs[2]), ["___stack0", "globalbias"])
+
     def test_stack_state1(self):
         def fn(a, b):
             t1 = 1.23 * a
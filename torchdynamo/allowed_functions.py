@@ -57,7 +57,10 @@ def make_function_id_set(lazy_initializer):
                 self.function_ids.remove(idx)
 
         def __contains__(self, idx: int):
-            return idx in self()
+            function_ids = self.function_ids
+            if function_ids is None:
+                function_ids = self()  # lazy init
+            return idx in function_ids
 
     return FunctionIdSet()
 
@@ -188,15 +191,19 @@ def _numpy_function_ids():
     return rv
 
 
+_torch_op_types = (
+    torch._ops.OpOverloadPacket,
+    torch._ops.OpOverload,
+    torch._ops._OpNamespace,
+)
+
+
 def is_allowed(obj):
     """Is this safe to trace like torch.add ?"""
     # torch.ops is populated lazily so we don't necessarily have them in
     # _allowed_function_ids.  Figure it out by testing the type instead
     # in those cases
-    return id(obj) in _allowed_function_ids or isinstance(
-        obj,
-        (torch._ops.OpOverloadPacket, torch._ops.OpOverload, torch._ops._OpNamespace),
-    )
+    return id(obj) in _allowed_function_ids or isinstance(obj, _torch_op_types)
 
 
 def torch_get_name(obj, default):
@@ -28,6 +28,8 @@ from .variables.tensor import UnspecializedPythonVariable
 
 @dataclasses.dataclass
 class GraphOutputEntry:
+    __slots__ = ("index", "variable")
+
     index: int
     variable: Variable
 
@@ -64,6 +66,8 @@ class PyCodegen(object):
         self.tx = tx
         self.graph_output_var = graph_output_var
         self.code_options = self.tx.output.code_options
+        self.varname_index = self.tx.output.varname_index
+        self.name_index = self.tx.output.name_index
         self.cell_and_freevars = self.tx.cell_and_freevars
         self.new_var = self.tx.output.new_var
 
@@ -151,7 +155,7 @@ class PyCodegen(object):
                 )
         elif isinstance(value, NNModuleVariable):
             parts = value.module_key.split(".")
-            if parts[0] in self.code_options["co_varnames"]:
+            if parts[0] in self.varname_index:
                 output.append(self.create_load(parts[0]))
                 parts = parts[1:]
             else:
@@ -213,10 +217,8 @@ class PyCodegen(object):
             return create_instruction(
                 "LOAD_DEREF", self.cell_and_freevars().index(name), name
             )
-        assert name in self.code_options["co_varnames"], f"{name} missing"
-        return create_instruction(
-            "LOAD_FAST", self.code_options["co_varnames"].index(name), name
-        )
+        assert name in self.varname_index, f"{name} missing"
+        return create_instruction("LOAD_FAST", self.varname_index[name], name)
 
     def create_load_closure(self, name):
         assert name in self.cell_and_freevars()
@@ -229,18 +231,14 @@ class PyCodegen(object):
             return create_instruction(
                 "STORE_DEREF", self.cell_and_freevars().index(name), name
             )
-        assert name in self.code_options["co_varnames"]
-        return create_instruction(
-            "STORE_FAST", self.code_options["co_varnames"].index(name), name
-        )
+        assert name in self.varname_index
+        return create_instruction("STORE_FAST", self.varname_index[name], name)
 
     def create_load_global(self, name, add=False):
         if add:
             self.tx.output.update_co_names(name)
-        assert name in self.code_options["co_names"], f"{name} not in co_names"
-        return create_instruction(
-            "LOAD_GLOBAL", self.code_options["co_names"].index(name), name
-        )
+        assert name in self.name_index, f"{name} not in co_names"
+        return create_instruction("LOAD_GLOBAL", self.name_index[name], name)
 
     def create_load_const(self, value):
         assert is_safe_constant(value), f"unsafe constant {value}"
@@ -268,11 +266,8 @@ class PyCodegen(object):
     create_load_output = _create_load_const
 
     def create_load_attr(self, name):
-        if name not in self.code_options["co_names"]:
-            self.code_options["co_names"] = self.code_options["co_names"] + (name,)
-        return create_instruction(
-            "LOAD_ATTR", self.code_options["co_names"].index(name), name
-        )
+        self.tx.output.update_co_names(name)
+        return create_instruction("LOAD_ATTR", self.name_index[name], name)
 
     def create_load_attrs(self, names):
         return [self.create_load_attr(name) for name in names.split(".")]
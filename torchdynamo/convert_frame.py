@@ -182,6 +182,8 @@ def convert_frame_assert(compiler_fn: Callable, guard_export_fn=None, one_graph=
     compiler_fn = wrap_compiler_fn(compiler_fn)
 
     def _convert_frame_assert(frame: types.FrameType, cache_size: int):
+        # Cheap checks on the code object run before entering
+        # wrap_convert_context(), which saves and restores RNG and grad state.
         code = frame.f_code
         input_codes.add(code)
         if code in output_codes:
@@ -210,6 +212,11 @@ def convert_frame_assert(compiler_fn: Callable, guard_export_fn=None, one_graph=
             # len keyword in LIST_LEN guard.
             return None
 
+        return _convert_frame_assert_in_context(frame, cache_size)
+
+    @wrap_convert_context
+    def _convert_frame_assert_in_context(frame: types.FrameType, cache_size: int):
+        code = frame.f_code
         if is_generator(code):
             unimplemented("generator")
         if cache_size >= config.cache_size_limit:
@@ -253,7 +260,7 @@ def convert_frame_assert(compiler_fn: Callable, guard_export_fn=None, one_graph=
             output = tracer.output
             assert output.output_instructions
             instructions[:] = output.output_instructions
-            code_options.update(output.code_options)
+            code_options.update(output.get_code_options())
 
             instructions[:] = passes.bytecode.common().execute(instructions)
 
@@ -323,11 +330,18 @@ def convert_frame_assert(compiler_fn: Callable, guard_export_fn=None, one_graph=
                 )
             raise InternalTorchDynamoError()
 
-    return wrap_convert_context(_convert_frame_assert)
+    return _convert_frame_assert
 
 
 def convert_frame(compiler_fn: typing.Callable, guard_export_fn=None):
-    """Try to convert a frame into an FX graph, if error leave frame unmodified"""
+    """Try to convert a frame into an FX graph, if error leave frame unmodified
+
+    Results are already cached per code object by the eval frame hook: a
+    returned GuardedCode is stored on the code object and reused while its
+    guards pass, and returning None marks the code as SKIP_CODE so it is
+    never offered to us again.  This is therefore only reached on a cache
+    miss, where any cached result would have failed its guards.
+    """
     inner_convert = convert_frame_assert(compiler_fn, guard_export_fn, one_graph=False)
 
     def _convert_frame(frame: types.FrameType, cache_size: int):
@@ -484,6 +484,11 @@ class CheckFunctionManager:
         self._seen_ids.clear()
 
     def compile_check_fn(self, local_builder, global_builder):
+        """
+        Codegen all guards into a single `lambda <locals>: a and b and ...`
+        exec'd once here, with tensor checks batched into the C++ TensorGuards.
+        The eval frame hook calls only this function per frame.
+        """
         assert not (set(local_builder.argnames) & set(global_builder.argnames))
         # see parallel handling of ".0" / "___implicit0" in _eval_frame.c
         args = [a for a in local_builder.scope.keys() if a == "___implicit0"]
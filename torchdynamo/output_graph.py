@@ -9,6 +9,8 @@ from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Set
 
 import torch.nn
 from torch import fx
@@ -72,8 +74,20 @@ class OutputGraph(fx.Tracer):
         self.nn_modules = dict()
         self.side_effects = SideEffects()
         self.code_options = dict(code_options)
+        # grown in place while tracing, see get_code_options()
+        self.code_options["co_varnames"] = list(code_options["co_varnames"])
+        self.code_options["co_names"] = list(code_options["co_names"])
         self.output_instructions = []
 
+        # name -> index maps kept in sync with code_options by new_var()
+        # and update_co_names() so codegen never scans the tuples
+        self.varname_index: Dict[str, int] = {
+            name: i for i, name in enumerate(self.code_options["co_varnames"])
+        }
+        self.name_index: Dict[str, int] = {
+            name: i for i, name in enumerate(self.code_options["co_names"])
+        }
+
         # Not checkpointed
         self.compiler_fn = compiler_fn
         self.root_globals = f_globals
@@ -81,6 +95,12 @@ class OutputGraph(fx.Tracer):
         self.cleanups = []
         self.should_exit = False
         self.random_values_var = None
+        # module_key -> object, derived from nn_modules and reset with it
+        self._submodule_cache: Dict[str, Any] = {}
+        # placeholder bookkeeping for create_graph_input(), rebuilt from
+        # self.graph whenever placeholders may have been erased
+        self._placeholder_names: Optional[Set[str]] = None
+        self._last_placeholder: Optional[fx.Node] = None
 
     @property
     def output(self):
@@ -110,6 +130,8 @@ class OutputGraph(fx.Tracer):
             self.nn_modules,
             self.side_effects,
         ) = state
+        self._submodule_cache.clear()
+        self._placeholder_names = None
         # FX deepcopy doesn't work for a partially created graph, so just remove new nodes
         for node in reversed(list(self.graph.nodes)):
             if node not in graph_nodes:
@@ -123,16 +145,24 @@ class OutputGraph(fx.Tracer):
         return count_calls(self.graph)
 
     def get_submodule(self, keys):
+        try:
+            return self._submodule_cache[keys]
+        except KeyError:
+            pass
         obj = self.nn_modules
         for k in keys.split("."):
             obj = obj[k] if isinstance(obj, dict) else getattr(obj, k)
+        self._submodule_cache[keys] = obj
         return obj
 
     def create_graph_input(self, name, type_expr=None):
-        placeholders = [n for n in self.graph.nodes if n.op == "placeholder"]
+        if self._placeholder_names is None:
+            placeholders = [n for n in self.graph.nodes if n.op == "placeholder"]
+            self._placeholder_names = {n.name for n in placeholders}
+            self._last_placeholder = placeholders[-1] if placeholders else None
 
         # unique
-        used_names = {n.name for n in placeholders}
+        used_names = self._placeholder_names
         if name in used_names:
             for i in itertools.count():
                 if f"{name}_{i}" not in used_names:
@@ -140,29 +170,37 @@ class OutputGraph(fx.Tracer):
                     break
 
         ctx = (
-            self.graph.inserting_after(placeholders[-1])
-            if placeholders
+            self.graph.inserting_after(self._last_placeholder)
+            if self._last_placeholder is not None
             else self.graph.inserting_before(None)
         )
         with ctx:
-            return self.create_proxy("placeholder", name, (), {}, type_expr=type_expr)
+            proxy = self.create_proxy("placeholder", name, (), {}, type_expr=type_expr)
+        self._last_placeholder = proxy.node
+        used_names.add(proxy.node.name)
+        return proxy
 
     def new_var(self, name="tmp"):
-        existing = set(self.code_options["co_varnames"])
+        existing = self.varname_index
         for i in itertools.count():
             var = f"___{name}_{i}"
             if var not in existing:
-                self.code_options["co_varnames"] = self.code_options["co_varnames"] + (
-                    var,
-                )
+                existing[var] = len(self.code_options["co_varnames"])
+                self.code_options["co_varnames"].append(var)
                 return var
 
     def update_co_names(self, name):
         """Ensure self.code_options.co_names contains name"""
-        if name not in self.code_options["co_names"]:
-            self.code_options["co_names"] = tuple(self.code_options["co_names"]) + (
-                name,
-            )
+        if name not in self.name_index:
+            self.name_index[name] = len(self.code_options["co_names"])
+            self.code_options["co_names"].append(name)
+
+    def get_code_options(self) -> Dict[str, Any]:
+        """code_options with co_varnames and co_names converted back to tuples"""
+        code_options = dict(self.code_options)
+        code_options["co_varnames"] = tuple(code_options["co_varnames"])
+        code_options["co_names"] = tuple(code_options["co_names"])
+        return code_options
 
     def add_submodule(self, mod: torch.nn.Module, *names, **options):
         if is_dynamic_nn_module(mod):
@@ -376,6 +414,7 @@ class OutputGraph(fx.Tracer):
                 self.graph.erase_node(node)
 
         self.graphargs = [arg for arg in self.graphargs if arg.uses > 0]
+        self._placeholder_names = None
 
     def add_output_instructions(self, prefix: List[Instruction]):
         """
@@ -400,6 +439,7 @@ class OutputGraph(fx.Tracer):
         # Note: generated fx graph will hold a reference to the nn_module,
         # So depending on the backend they may not be released
         self.nn_modules = None
+        self._submodule_cache.clear()
 
         # Cleanup graphargs
         for graph_arg in self.graphargs:
@@ -80,9 +80,26 @@ def stack_op(fn: Callable):
     nargs = len(inspect.signature(fn).parameters)
     fn_var = BuiltinVariable(fn)
 
-    @functools.wraps(fn)
-    def impl(self: "InstructionTranslatorBase", inst: Instruction):
-        self.push(fn_var.call_function(self, self.popn(nargs), {}))
+    # UNARY_* and BINARY_*/INPLACE_* pop their operands directly
+    if nargs == 1:
+
+        @functools.wraps(fn)
+        def impl(self: "InstructionTranslatorBase", inst: Instruction):
+            self.push(fn_var.call_function(self, [self.pop()], {}))
+
+    elif nargs == 2:
+
+        @functools.wraps(fn)
+        def impl(self: "InstructionTranslatorBase", inst: Instruction):
+            b = self.pop()
+            a = self.pop()
+            self.push(fn_var.call_function(self, [a, b], {}))
+
+    else:
+
+        @functools.wraps(fn)
+        def impl(self: "InstructionTranslatorBase", inst: Instruction):
+            self.push(fn_var.call_function(self, self.popn(nargs), {}))
 
     return impl
 
@@ -204,7 +221,7 @@ class InstructionTranslatorBase(object):
 
         cache = dict()
         self.output.side_effects.apply(repl, cache)
-        self.stack = [Variable.apply(repl, x, cache) for x in self.stack]
+        self.stack[:] = [Variable.apply(repl, x, cache) for x in self.stack]
         for k, x in self.symbolic_locals.items():
             self.symbolic_locals[k] = Variable.apply(repl, x, cache)
 
@@ -236,31 +253,35 @@ class InstructionTranslatorBase(object):
             self.restore_graphstate(state)
             raise
 
-    def simulator(self):
-        while True:
-            if self.instruction_pointer is None:
-                break
-            self.current_instruction = self.instructions[self.instruction_pointer]
-            self.instruction_pointer = self.instruction_pointer + 1
-            if self.instruction_pointer < len(self.instructions):
-                self.next_instruction = self.instructions[self.instruction_pointer]
-            else:
-                self.next_instruction = None
-                self.instruction_pointer = None
-            if self.current_instruction.starts_line:
-                self.lineno = self.current_instruction.starts_line
-            yield self.current_instruction
+    def step(self) -> Optional[Instruction]:
+        """Advance to the next instruction and return it, None when done"""
+        ip = self.instruction_pointer
+        if ip is None:
+            return None
+        instructions = self.instructions
+        inst = self.current_instruction = instructions[ip]
+        ip += 1
+        if ip < len(instructions):
+            self.instruction_pointer = ip
+            self.next_instruction = instructions[ip]
+        else:
+            self.instruction_pointer = None
+            self.next_instruction = None
+        if inst.starts_line:
+            self.lineno = inst.starts_line
+        return inst
 
     def emit(self, inst):
         # FIXME: drop checkpoint logic
         if len(self.stack) == 0 and self.should_compile_partial_graph():
             self.checkpoint = inst, self.copy_graphstate()
 
-        if not hasattr(self, inst.opname):
+        handler = self._handlers[inst.index]
+        if handler is None:
             unimplemented(f"missing: {inst.opname}")
 
         try:
-            getattr(self, inst.opname)(inst)
+            handler(self, inst)
             return inst.opname != "RETURN_VALUE"
         except Unsupported as exc:
             exc.real_stack.append(self.frame_summary())
@@ -282,8 +303,9 @@ class InstructionTranslatorBase(object):
 
     def run(self):
         try:
-            for inst in self.simulator():
-                if self.output.should_exit:
+            while True:
+                inst = self.step()
+                if inst is None or self.output.should_exit:
                     break
                 if not self.emit(inst):
                     break
@@ -315,20 +337,17 @@ class InstructionTranslatorBase(object):
             if isinstance(self, InstructionTranslator):
                 self.output.cleanup()
 
-    @typechecked
-    def push(self, val: Optional[Variable]):
-        self.stack.append(val)
-
     def push_many(self, vals: List[TensorVariable]):
         for val in vals:
             self.push(val)
 
-    def pop(self) -> TensorVariable:
-        return self.stack.pop()
-
     def popn(self, n: int) -> List[TensorVariable]:
-        assert n >= 0
-        return list(reversed([self.pop() for _ in range(n)]))
+        assert 0 <= n <= len(self.stack)
+        if not n:
+            return []
+        items = self.stack[-n:]
+        del self.stack[-n:]
+        return items
 
     def LOAD_FAST(self, inst):
         name = inst.argval
@@ -441,7 +460,7 @@ class InstructionTranslatorBase(object):
         self.push(vars.build(self, GlobalSource(inst.argval))(val))
 
     def jump(self, inst):
-        self.instruction_pointer = self.indexof[id(inst.target)]
+        self.instruction_pointer = inst.target.index
 
     JUMP_FORWARD = jump
     JUMP_ABSOLUTE = jump
@@ -703,19 +722,16 @@ class InstructionTranslatorBase(object):
         self.output.guards.update(result.guards)
 
     def BUILD_TUPLE(self, inst):
-        items = self.popn(inst.argval)
-        options = vars.propagate(items)
-        self.push(TupleVariable(items, **options))
+        self.push(TupleVariable.create_propagating(self.popn(inst.argval)))
 
     def BUILD_SLICE(self, inst):
-        items = self.popn(inst.argval)
-        options = vars.propagate(items)
-        self.push(SliceVariable(items, **options))
+        self.push(SliceVariable.create_propagating(self.popn(inst.argval)))
 
     def BUILD_LIST(self, inst):
         items = self.popn(inst.argval)
-        options = vars.propagate(items)
-        self.push(ListVariable(items, mutable_local=MutableLocal(), **options))
+        self.push(
+            ListVariable.create_propagating(items, mutable_local=MutableLocal())
+        )
 
     def BUILD_LIST_UNPACK(self, inst, cls=ListVariable):
         seqs = self.popn(inst.argval)
@@ -737,10 +753,10 @@ class InstructionTranslatorBase(object):
         items = self.popn(inst.argval * 2)
         options = vars.propagate(items)
         result = dict()
-        for k, v in zip(items[::2], items[1::2]):
+        for i in range(0, len(items), 2):
+            k = items[i]
             assert isinstance(k, ConstantVariable)
-            result[k.value] = v
-        assert len(result) == len(items) / 2
+            result[k.value] = items[i + 1]
         self.push(vars.constdict(result, dict, mutable_local=MutableLocal(), **options))
 
     def BUILD_CONST_KEY_MAP(self, inst):
@@ -881,42 +897,25 @@ class InstructionTranslatorBase(object):
     def POP_TOP(self, inst):
         self.pop()
 
+    # stack shuffles are done in place rather than with pop()/push() pairs
+
     def ROT_TWO(self, inst):
-        a = self.pop()
-        b = self.pop()
-        self.push(a)
-        self.push(b)
+        s = self.stack
+        s[-1], s[-2] = s[-2], s[-1]
 
     def ROT_THREE(self, inst):
-        a = self.pop()
-        b = self.pop()
-        c = self.pop()
-        self.push(a)
-        self.push(c)
-        self.push(b)
+        s = self.stack
+        s[-1], s[-2], s[-3] = s[-2], s[-3], s[-1]
 
     def ROT_FOUR(self, inst):
-        a = self.pop()
-        b = self.pop()
-        c = self.pop()
-        d = self.pop()
-        self.push(a)
-        self.push(d)
-        self.push(c)
-        self.push(b)
+        s = self.stack
+        s[-1], s[-2], s[-3], s[-4] = s[-2], s[-3], s[-4], s[-1]
 
     def DUP_TOP(self, inst):
-        a = self.pop()
-        self.push(a)
-        self.push(a)
+        self.stack.append(self.stack[-1])
 
     def DUP_TOP_TWO(self, inst):
-        a = self.pop()
-        b = self.pop()
-        self.push(b)
-        self.push(a)
-        self.push(b)
-        self.push(a)
+        self.stack.extend(self.stack[-2:])
 
     def FORMAT_VALUE(self, inst):
         flags = inst.arg
@@ -1079,13 +1078,15 @@ class InstructionTranslatorBase(object):
         (
             output_state,
             self.symbolic_locals,
-            self.stack,
+            stack,
             self.block_stack,
             self.instruction_pointer,
             self.current_instruction,
             self.next_instruction,
             self.lineno,
         ) = state
+        # push/pop are bound to this list, so refill it rather than rebind
+        self.stack[:] = stack
         self.output.restore_graphstate(output_state)
 
     def empty_checkpoint(self):
@@ -1136,6 +1137,10 @@ class InstructionTranslatorBase(object):
         self.symbolic_locals: Dict[str, Variable] = symbolic_locals
         self.symbolic_globals: Dict[str, Variable] = symbolic_globals
         self.stack: List[Variable] = []
+        # bound list methods save an attribute lookup and a Python call per
+        # push/pop; self.stack must only be updated in place from here on
+        self.push: Callable[[Optional[Variable]], None] = self.stack.append
+        self.pop: Callable[[], Variable] = self.stack.pop
         self.instruction_pointer: int = 0
         self.current_instruction: Instruction = create_instruction("NOP")
         self.next_instruction: Optional[Instruction] = None
@@ -1144,7 +1149,14 @@ class InstructionTranslatorBase(object):
 
         # Properties of the input/output code
         self.instructions: List[Instruction] = instructions
-        self.indexof: Dict[int, int] = {id(i): n for n, i in enumerate(instructions)}
+        for n, i in enumerate(instructions):
+            # jump() reads the target's position directly off the instruction
+            i.index = n
+        # opcode handler for each instruction, indexed like instructions;
+        # unbound so the tracer does not hold a reference cycle to itself
+        self._handlers: List[Optional[Callable[[Any, Instruction], None]]] = [
+            getattr(type(self), i.opname, None) for i in instructions
+        ]
         self.f_globals: Dict[str, Any] = f_globals
         self.f_builtins: Dict[str, Any] = f_builtins
         self.code_options: Dict[str, Any] = code_options
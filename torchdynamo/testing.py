@@ -1,3 +1,4 @@
+import collections
 import contextlib
 import dis
 import functools
@@ -167,7 +168,7 @@ class TestCase(unittest.TestCase):
 
     def tearDown(self):
         for k, v in torchdynamo.utils.counters.items():
-            print(k, v.most_common())
+            print(k, collections.Counter(v).most_common())
         torchdynamo.reset()
         torchdynamo.utils.counters.clear()
 
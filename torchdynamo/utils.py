@@ -29,7 +29,7 @@ import torchdynamo.config
 from . import config
 
 log = logging.getLogger(__name__)
-counters = collections.defaultdict(collections.Counter)
+counters = collections.defaultdict(lambda: collections.defaultdict(int))
 
 
 LOGGING_CONFIG = dict(
@@ -53,12 +53,11 @@ LOGGING_CONFIG = dict(
 )
 
 
+_CALL_OPS = frozenset(("call_function", "call_method", "call_module"))
+
+
 def count_calls(g: fx.Graph):
-    c = 0
-    for n in g.nodes:
-        if "call" in n.op:
-            c += 1
-    return c
+    return sum(1 for n in g.nodes if n.op in _CALL_OPS)
 
 
 def identity(x):
@@ -138,8 +137,11 @@ def is_numpy_float_type(value):
 
 def istensor(obj):
     """Check of obj is a tensor"""
-    return istype(
-        obj, (torch.Tensor, torch.nn.Parameter, *config.traceable_tensor_subclasses)
+    obj_type = type(obj)
+    return (
+        obj_type is torch.Tensor
+        or obj_type is torch.nn.Parameter
+        or obj_type in config.traceable_tensor_subclasses
     )
 
 
@@ -165,7 +167,7 @@ def make_cell(val=None):
 
 def proxy_args_kwargs(args, kwargs):
     try:
-        proxy_args = tuple(arg.as_proxy() for arg in args)
+        proxy_args = tuple([arg.as_proxy() for arg in args])
         proxy_kwargs = {key: arg.as_proxy() for key, arg in kwargs.items()}
         return proxy_args, proxy_kwargs
     except NotImplementedError:
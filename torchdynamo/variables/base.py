@@ -49,6 +49,17 @@ class VariableTracker:
     @staticmethod
     def propagate(*vars: List[List["VariableTracker"]]):
         """Combine the guards from many VariableTracker into **kwargs for a new instance"""
+        return {
+            "guards": VariableTracker._combine_guards(vars),
+        }
+
+    @classmethod
+    def create_propagating(cls, items: List["VariableTracker"], **kwargs):
+        """cls(items, **kwargs) carrying the guards of items, like propagate()"""
+        return cls(items, guards=VariableTracker._combine_guards(items), **kwargs)
+
+    @staticmethod
+    def _combine_guards(vars) -> Set:
         guards = set()
 
         def visit(var):
@@ -65,9 +76,7 @@ class VariableTracker:
                 guards.update(var.guards)
 
         visit(vars)
-        return {
-            "guards": guards,
-        }
+        return guards
 
     def clone(self, **kwargs):
         """Shallow copy with some (optional) changes"""
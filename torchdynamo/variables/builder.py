@@ -68,6 +68,8 @@ from .user_defined import UserDefinedObjectVariable
 
 @dataclasses.dataclass
 class GraphArg:
+    __slots__ = ("source", "example", "is_unspecialized", "uses")
+
     source: Source
     example: Any
     is_unspecialized: bool
@@ -156,9 +156,9 @@ class BuiltinVariable(Variable):
         return check_constant_args(args, kwargs)
 
     def tensor_args(self, *args, **kwargs):
+        tensor_cls = vars.TensorVariable
         return any(
-            isinstance(i, vars.TensorVariable)
-            for i in itertools.chain(args, kwargs.values())
+            isinstance(i, tensor_cls) for i in itertools.chain(args, kwargs.values())
         )
 
     def unspec_numpy_args(self, *args, **kwargs):
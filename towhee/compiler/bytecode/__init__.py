@@ -14,7 +14,7 @@ class Instruction(dataobject):
 
     >>> inst = Instruction(0, "test_inst", None, 0)
     >>> inst
-    Instruction(opcode=0, opname='test_inst', arg=None, argval=0, offset=None, starts_line=None, is_jump_target=False, target=None, argrepr=None)
+    Instruction(opcode=0, opname='test_inst', arg=None, argval=0, offset=None, starts_line=None, is_jump_target=False, target=None, argrepr=None, index=None)
 
     2. the instruction object is mutable:
 
@@ -31,6 +31,8 @@ class Instruction(dataobject):
     # extra fields to make modification easier:
     target: Optional[dis.Instruction] = None
     argrepr: Optional[str] = None
+    # position in the instruction list being traced, assigned by the tracer
+    index: Optional[int] = None
 
     # def __hash__(self):
     #     return id(self)
@@ -205,7 +205,7 @@ class TorchFrameCompiler(FrameCompiler):
         tracer.run()
         self.output = tracer.output
         instructions[:] = self.output.output_instructions
-        code_options.update(self.output.code_options)
+        code_options.update(self.output.get_code_options())
 
         instructions[:] = passes.bytecode.common().execute(instructions)
 